@@ -1,29 +1,40 @@
 # -*- coding: utf-8 -*-
 import re
-import fitz  # PyMuPDF
-from keybert import KeyBERT
-from sentence_transformers import SentenceTransformer
 
-# === 1) PDF 앞 N페이지 텍스트 추출 ===
-def extract_pdf_head_text(path: str, n_pages: int = 1) -> str:
+_WS_NL = re.compile(r"[ \t]+\n")
+_MULTI_NL = re.compile(r"\n{3,}")
+# 공백 정규화 뒤에 적용하므로 문장 사이 구분자는 항상 공백 한 칸이다.
+_SENT_SPLIT = re.compile(r"(?<=[.!?]) (?=[가-힣A-Z0-9])")
+
+
+def _page_text(page) -> str:
+    # 줄 끝 공백은 페이지 단위로 정리해 문서 전체 크기의 중간 문자열을 하나 줄인다.
+    # 페이지 끝 공백은 join 시 붙는 개행 앞 공백이 되므로 함께 제거한다.
+    text = page.get_text("text") or ""
+    return _WS_NL.sub("\n", text).rstrip(" \t")
+
+
+def _read_pages(path: str, n_pages: int) -> list[str]:
+    import fitz  # PyMuPDF — 문장 분할만 쓰는 경로에서는 로드하지 않는다.
+
     with fitz.open(path) as doc:
         pages = min(n_pages, doc.page_count)
-        parts = []
-        for i in range(pages):
-            page = doc.load_page(i)
-            parts.append(page.get_text("text") or "")
-    text = "\n".join(parts)
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+        return [_page_text(doc.load_page(i)) for i in range(pages)]
+
+
+# === 1) PDF 앞 N페이지 텍스트 추출 ===
+def extract_pdf_head_text(path: str, n_pages: int = 1) -> str:
+    parts = _read_pages(path, n_pages)
+    text = _MULTI_NL.sub("\n\n", "\n".join(parts))
     return text.strip()
 
 # === 2) 한국어 문장 분할 ===
 def split_sentences_ko(text: str):
-    text = re.sub(r"\s+", " ", text)
-    sents = re.split(r"(?<=[\.!\?])\s+(?=[가-힣A-Z0-9])", text)
-    fixed = []
-    for s in sents:
-        fixed += re.split(r"(?<=다\.)\s+(?=[가-힣A-Z0-9])", s)
-    return [s.strip() for s in fixed if len(s.strip()) >= 8]
+    # str.split()은 정규식 \s와 같은 공백 집합을 C 수준에서 나누므로 re.sub보다 빠르고,
+    # 양끝 공백도 함께 제거되어 분할된 문장을 다시 strip할 필요가 없다.
+    text = " ".join(text.split())
+    # "다." 경계는 [.!?] 경계에 포함되므로 한 번의 분할로 충분하다.
+    sents = _SENT_SPLIT.split(text)
+    return [s for s in sents if len(s) >= 8]
 
 
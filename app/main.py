@@ -1,4 +1,8 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, status
@@ -13,12 +17,27 @@ from app.schemas.folder import (
 from app.schemas.keyword import KeywordExtractionRequest, KeywordExtractionResponse
 from app.services.folder_inspection import DirectoryInspectionError, inspect_directory
 from app.services.folder_snapshot import snapshot_directory
-from app.services.text_analysis.keyword_extractor import keybert_analyze
+from app.services.text_analysis.keyword_extractor import keybert_analyze, preload_models
 
 
 load_dotenv()
 
-app = FastAPI(title="Nebula Client API")
+# 임베딩 추론은 CPU 바운드이므로 전용 스레드 풀로 동시 실행 수를 제한한다.
+_KEYWORD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("KEYWORD_WORKERS", "2")),
+    thread_name_prefix="keyword",
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # 키워드 모델을 기동 시점에 미리 올려 첫 /text/keywords 요청의 콜드 스타트를 없앤다.
+    if os.getenv("PRELOAD_MODELS", "1") == "1":
+        preload_models()
+    yield
+
+
+app = FastAPI(title="Nebula Client API", lifespan=lifespan)
 
 
 @app.get("/health")
@@ -52,14 +71,17 @@ def snapshot_folder(payload: FolderSnapshotRequest) -> FolderSnapshotResponse:
             detail=str(exc),
         ) from exc
 
-    return FolderSnapshotResponse(
+    # 서비스 계층에서 만든 값이므로 검증 없이 모델을 구성한다.
+    # pydantic은 모델 인스턴스를 재검증하지 않아 response_model 단계에서도 검증되지 않으므로
+    # (ge=0, datetime 등) 제약은 snapshot_directory가 올바른 값을 만드는 것에 의존한다.
+    return FolderSnapshotResponse.model_construct(
         directory=result.directory,
         generated_at=result.generated_at,
         total_entries=result.total_entries,
         page_size=result.page_size,
         page_count=result.page_count,
         pages=[
-            SnapshotPageInfo(
+            SnapshotPageInfo.model_construct(
                 page=page.page,
                 path=str(page.path),
                 entry_count=page.entry_count,
@@ -70,10 +92,13 @@ def snapshot_folder(payload: FolderSnapshotRequest) -> FolderSnapshotResponse:
 
 
 @app.post("/text/keywords", response_model=KeywordExtractionResponse)
-def extract_keywords(payload: KeywordExtractionRequest) -> KeywordExtractionResponse:
+async def extract_keywords(payload: KeywordExtractionRequest) -> KeywordExtractionResponse:
     """텍스트에서 키워드와 중요 문장을 추출합니다."""
     try:
-        keywords, key_sentences = keybert_analyze(payload.text)
+        loop = asyncio.get_running_loop()
+        keywords, key_sentences = await loop.run_in_executor(
+            _KEYWORD_EXECUTOR, keybert_analyze, payload.text
+        )
         return KeywordExtractionResponse(
              keywords=keywords,
              key_sentences=key_sentences
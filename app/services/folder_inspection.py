@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import stat
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,6 +10,8 @@ from typing import Iterable
 
 from app.schemas.folder import FileInfo, FolderContentsResponse
 
+_UTC = timezone.utc
+
 
 class DirectoryInspectionError(Exception):
     """Raised when a directory cannot be inspected."""
@@ -27,12 +30,14 @@ class DirectoryEntry:
     @classmethod
     def from_path(cls, entry_path: Path) -> "DirectoryEntry":
         stats = entry_path.stat()
+        # is_dir()은 내부적으로 stat을 다시 호출하므로 이미 얻은 st_mode로 판별한다.
+        is_directory = stat.S_ISDIR(stats.st_mode)
         return cls(
             name=entry_path.name,
             path=entry_path,
-            is_directory=entry_path.is_dir(),
-            size_bytes=0 if entry_path.is_dir() else stats.st_size,
-            modified_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
+            is_directory=is_directory,
+            size_bytes=0 if is_directory else stats.st_size,
+            modified_at=datetime.fromtimestamp(stats.st_mtime, _UTC),
         )
 
 
@@ -68,8 +73,11 @@ def inspect_directory(raw_path: str) -> FolderContentsResponse:
     """Return metadata for the immediate children of the provided directory."""
 
     directory = resolve_directory(raw_path)
+    # stat() 결과로 직접 만든 값이므로 항목별 pydantic 검증을 생략한다.
+    # FastAPI의 response_model도 모델 인스턴스를 재검증하지 않으므로 FileInfo 제약
+    # (size_bytes >= 0, datetime 타입)은 DirectoryEntry가 올바른 값을 만드는 것에 의존한다.
     entries = [
-        FileInfo(
+        FileInfo.model_construct(
             name=entry.name,
             path=str(entry.path),
             is_directory=entry.is_directory,
@@ -79,4 +87,4 @@ def inspect_directory(raw_path: str) -> FolderContentsResponse:
         for entry in _iter_directory_entries(directory)
     ]
 
-    return FolderContentsResponse(directory=str(directory), entries=entries)
+    return FolderContentsResponse.model_construct(directory=str(directory), entries=entries)
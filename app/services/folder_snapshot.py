@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import os
 import logging
+import stat
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+import orjson
 
 from app.services.folder_inspection import DirectoryInspectionError, resolve_directory
 
@@ -17,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 _SNAPSHOT_ENV_VAR = "SNAPSHOT_DIR"
 _DEFAULT_SNAPSHOT_DIR = "snapshots"
+# 항목마다 호출되는 fromtimestamp에 키워드 인자와 속성 조회 없이 넘긴다.
+_UTC = timezone.utc
 
 
 @dataclass(frozen=True)
@@ -30,21 +34,21 @@ class SnapshotEntry:
     modified_at: datetime
 
     @classmethod
-    def from_path(cls, root: Path, path: Path) -> "SnapshotEntry":
+    def from_dir_entry(cls, entry: os.DirEntry, relative_path: str) -> "SnapshotEntry":
         try:
-            stats = path.stat()
+            stats = entry.stat()
         except FileNotFoundError as exc:
             raise DirectoryInspectionError("스냅샷 대상 파일을 찾을 수 없습니다.") from exc
         except PermissionError as exc:
             raise DirectoryInspectionError("파일에 접근 권한이 없습니다.") from exc
 
-        is_directory = path.is_dir()
+        is_directory = stat.S_ISDIR(stats.st_mode)
         return cls(
-            relative_path=str(path.relative_to(root)),
-            absolute_path=str(path),
+            relative_path=relative_path,
+            absolute_path=entry.path,
             is_directory=is_directory,
             size_bytes=0 if is_directory else stats.st_size,
-            modified_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
+            modified_at=datetime.fromtimestamp(stats.st_mtime, _UTC),
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -53,7 +57,7 @@ class SnapshotEntry:
             "absolute_path": self.absolute_path,
             "is_directory": self.is_directory,
             "size_bytes": self.size_bytes,
-            "modified_at": self.modified_at.isoformat(),
+            "modified_at": self.modified_at,
         }
 
 
@@ -86,15 +90,40 @@ def snapshot_directory(raw_path: str, page_size: Optional[int] = None) -> Folder
 
     directory = resolve_directory(raw_path)
     logger.info('디렉터리 스냅샷 시작: path=%s, page_size=%s', directory, page_size)
-    entries = list(_iter_snapshot_entries(directory))
-    logger.info('항목 수집 완료: path=%s, entries=%d', directory, len(entries))
     generated_at = datetime.now(timezone.utc)
+    snapshot_root = _ensure_snapshot_root()
+
+    if page_size is None or page_size <= 0:
+        # 단일 파일은 순회 결과를 메모리에 모으지 않고 바로 파일로 흘려보낸다.
+        output_path = _build_snapshot_path(snapshot_root, directory, generated_at, 1, 1)
+        logger.info('스냅샷 파일 생성: path=%s, page=1/1', output_path)
+        total_entries = _write_snapshot_file(
+            output_path=output_path,
+            directory=directory,
+            generated_at=generated_at,
+            total_entries=None,
+            page_index=1,
+            page_count=1,
+            page_size=page_size,
+            entries=_iter_snapshot_entries(directory, exclude=snapshot_root),
+        )
+        logger.info('항목 수집 완료: path=%s, entries=%d', directory, total_entries)
+        return FolderSnapshotResult(
+            directory=str(directory),
+            generated_at=generated_at,
+            total_entries=total_entries,
+            page_size=page_size,
+            pages=[SnapshotPage(page=1, path=output_path, entry_count=total_entries)],
+        )
+
+    # 페이지 분할 시에는 각 파일 헤더에 전체 항목 수/페이지 수가 들어가므로 항목 목록이 먼저 필요하다.
+    entries = list(_iter_snapshot_entries(directory, exclude=snapshot_root))
+    logger.info('항목 수집 완료: path=%s, entries=%d', directory, len(entries))
 
     chunks = _chunk_entries(entries, page_size)
     if not chunks:
         chunks = [entries]
 
-    snapshot_root = _ensure_snapshot_root()
     pages: List[SnapshotPage] = []
 
     for index, chunk in enumerate(chunks, start=1):
@@ -137,26 +166,55 @@ def _ensure_snapshot_root() -> Path:
     return root
 
 
-def _iter_snapshot_entries(root: Path) -> Iterable[SnapshotEntry]:
-    for current_dir, dirnames, filenames in os.walk(root):
-        current_path = Path(current_dir)
+def _iter_snapshot_entries(root: Path, exclude: Optional[Path] = None) -> Iterator[SnapshotEntry]:
+    # 순회 중 발생한 OSError(ELOOP, ENAMETOOLONG 등)를 파일 저장 오류와 구분되는 오류로 바꾼다.
+    try:
+        yield from _walk_snapshot_entries(root, exclude)
+    except OSError as exc:
+        raise DirectoryInspectionError("스냅샷 대상 항목을 읽을 수 없습니다.") from exc
 
-        dirnames[:] = sorted(
-            [name for name in dirnames if not name.startswith(".")],
-            key=lambda name: name.lower(),
-        )
-        visible_files = sorted(
-            [name for name in filenames if not name.startswith(".")],
-            key=lambda name: name.lower(),
-        )
 
-        for directory_name in dirnames:
-            directory_path = current_path / directory_name
-            yield SnapshotEntry.from_path(root, directory_path)
+def _walk_snapshot_entries(root: Path, exclude: Optional[Path]) -> Iterator[SnapshotEntry]:
+    # os.walk와 같은 순서(디렉터리 우선, 이름순, 깊이 우선)로 순회하되,
+    # scandir의 DirEntry가 캐시한 타입/stat 정보를 그대로 사용한다.
+    # 스택에는 (절대 경로, 루트 기준 상대 경로 접두사)를 쌓아 relpath 계산을 피한다.
+    stack = [(str(root), "")]
+    # 스냅샷 저장 디렉터리가 대상 트리 안에 있으면 작성 중인 스냅샷 파일까지 나열되므로 제외한다.
+    excluded = str(exclude) if exclude is not None else None
 
-        for file_name in visible_files:
-            file_path = current_path / file_name
-            yield SnapshotEntry.from_path(root, file_path)
+    while stack:
+        current_dir, prefix = stack.pop()
+        try:
+            with os.scandir(current_dir) as iterator:
+                visible = sorted(
+                    (
+                        entry
+                        for entry in iterator
+                        if not entry.name.startswith(".") and entry.path != excluded
+                    ),
+                    key=lambda entry: entry.name.lower(),
+                )
+        except OSError:
+            # os.walk와 마찬가지로 읽을 수 없는 디렉터리는 건너뛴다.
+            continue
+
+        directories: list[os.DirEntry] = []
+        files: list[os.DirEntry] = []
+        for entry in visible:
+            (directories if entry.is_dir() else files).append(entry)
+
+        for entry in directories:
+            yield SnapshotEntry.from_dir_entry(entry, prefix + entry.name)
+
+        for entry in files:
+            yield SnapshotEntry.from_dir_entry(entry, prefix + entry.name)
+
+        # 심볼릭 링크 디렉터리는 나열만 하고 따라 들어가지 않는다.
+        stack.extend(
+            (entry.path, prefix + entry.name + os.sep)
+            for entry in reversed(directories)
+            if not entry.is_symlink()
+        )
 
 
 def _chunk_entries(entries: list[SnapshotEntry], page_size: Optional[int]) -> list[list[SnapshotEntry]]:
@@ -188,24 +246,47 @@ def _write_snapshot_file(
     output_path: Path,
     directory: Path,
     generated_at: datetime,
-    total_entries: int,
+    total_entries: Optional[int],
     page_index: int,
     page_count: int,
     page_size: Optional[int],
-    entries: list[SnapshotEntry],
-) -> None:
-    payload = {
-        "directory": str(directory),
-        "generated_at": generated_at.isoformat(),
-        "page": page_index,
-        "page_count": page_count,
-        "page_size": page_size,
-        "total_entries": total_entries,
-        "entries": [entry.to_dict() for entry in entries],
-    }
+    entries: Iterable[SnapshotEntry],
+) -> int:
+    """Stream entries into a JSON snapshot file and return how many were written.
+
+    ``total_entries`` is always written after the entries array; when it is None
+    it is counted while writing, so the caller can pass a lazy iterator.
+    """
+
+    header = (
+        ("directory", str(directory)),
+        ("generated_at", generated_at),
+        ("page", page_index),
+        ("page_count", page_count),
+        ("page_size", page_size),
+    )
 
+    written = 0
     try:
-        with output_path.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, ensure_ascii=False, indent=2)
+        # 항목을 하나씩 직렬화해 기록하므로 전체 dict 목록이나 문서 전체 바이트를 만들지 않는다.
+        # 순회 중 OSError는 _iter_snapshot_entries에서 이미 변환되므로 여기서 잡히는 것은 쓰기 오류뿐이다.
+        with output_path.open("wb") as fp:
+            fp.write(b"{")
+            for key, value in header:
+                fp.write(b'\n  "%s": %s,' % (key.encode("ascii"), orjson.dumps(value)))
+            fp.write(b'\n  "entries": [')
+            for entry in entries:
+                fp.write(b",\n    " if written else b"\n    ")
+                fp.write(orjson.dumps(entry.to_dict()))
+                written += 1
+            fp.write(b"\n  ]," if written else b"],")
+            count = written if total_entries is None else total_entries
+            fp.write(b'\n  "total_entries": %d\n}\n' % count)
     except OSError as exc:
+        output_path.unlink(missing_ok=True)
         raise DirectoryInspectionError("스냅샷 파일을 저장할 수 없습니다.") from exc
+    except DirectoryInspectionError:
+        output_path.unlink(missing_ok=True)
+        raise
+
+    return written
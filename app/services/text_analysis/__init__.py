@@ -1,4 +1,4 @@
-from .keyword_extractor import keybert_analyze
+from .keyword_extractor import keybert_analyze, preload_models
 from .sentence_splitter import split_sentences_ko
 
-__all__ = ["keybert_analyze", "split_sentences_ko"]
+__all__ = ["keybert_analyze", "preload_models", "split_sentences_ko"]
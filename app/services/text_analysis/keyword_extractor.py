@@ -3,17 +3,21 @@
 keyword_extractor.py
 - KeyBERT로 한국어 키워드/핵심문장 추출
 - 모델 로딩은 모듈 전역에서 1회만 실행(캐싱)
+- 동일 입력에 대한 분석 결과는 LRU로 재사용
 """
 
 from __future__ import annotations
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
 from typing import List, Tuple
 
 # sentence_splitter 모듈이 있으면 우선 사용, 없으면 로컬 구현 사용
 try:
     from .sentence_splitter import split_sentences_ko  # type: ignore
 except Exception:
-    import re
-
     def split_sentences_ko(text: str) -> List[str]:
         """마침표/물음표/느낌표 기준 단문 분할 (아주 단순 버전)."""
         if not text or not text.strip():
@@ -26,18 +30,95 @@ except Exception:
 _KEYBERT = None
 _SENT_EMBED = None
 _MODEL_NAME = "jhgan/ko-sroberta-multitask"
+_MODEL_LOCK = threading.Lock()
+_BATCH_SIZE_ENV_VAR = "EMBED_BATCH_SIZE"
+_DEFAULT_BATCH_SIZE = 64
+# torch(기본) | onnx | openvino — onnx/openvino는 optimum 추가 설치 필요
+_BACKEND_ENV_VAR = "EMBED_BACKEND"
+_DEFAULT_BACKEND = "torch"
+# 1이면 torch 백엔드의 Linear 레이어를 int8 동적 양자화 (CPU 추론 가속, 정확도 소폭 손실)
+_INT8_ENV_VAR = "EMBED_INT8"
+
+# --- 추출 파라미터 ---
+_KEYPHRASE_NGRAM_RANGE = (5, 10)  # 핵심 구절은 긴 n-gram 위주
+# 이보다 짧은 입력은 임베딩 없이 빈 결과를 돌려준다.
+_MIN_TEXT_CHARS = 20
+_MIN_TEXT_WORDS = 3
+# KeyBERT가 쓰는 CountVectorizer의 기본 토큰 패턴. 토큰이 n-gram 하한보다 적은
+# 문장은 후보 구절이 없어 KeyBERT도 빈 결과를 내므로 미리 걸러낸다.
+_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# --- 분석 결과 캐시 (입력 텍스트 해시 -> 결과) ---
+_RESULT_CACHE_SIZE = 128
+_RESULT_CACHE: "OrderedDict[bytes, Tuple[tuple, tuple]]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _quantize_int8(embed) -> None:
+    """SentenceTransformer 내부 트랜스포머의 Linear 레이어를 int8로 동적 양자화."""
+    import torch
+
+    transformer = embed[0]
+    transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+        transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+    )
 
 
 def _get_models():
     """KeyBERT와 SentenceTransformer를 전역으로 1회 로드."""
     global _KEYBERT, _SENT_EMBED
-    if _KEYBERT is None or _SENT_EMBED is None:
-        from sentence_transformers import SentenceTransformer
-        from keybert import KeyBERT
-
-        _SENT_EMBED = SentenceTransformer(_MODEL_NAME)
-        _KEYBERT = KeyBERT(model=_SENT_EMBED)
-    return _KEYBERT, _SENT_EMBED
+    if _KEYBERT is not None and _SENT_EMBED is not None:
+        return _KEYBERT, _SENT_EMBED
+
+    # 동시 요청이 각자 모델을 올리지 않도록 잠금 안에서 다시 확인한다.
+    with _MODEL_LOCK:
+        if _KEYBERT is None or _SENT_EMBED is None:
+            from sentence_transformers import SentenceTransformer
+            from keybert import KeyBERT
+            from keybert.backend import SentenceTransformerBackend
+
+            backend = os.getenv(_BACKEND_ENV_VAR, _DEFAULT_BACKEND)
+            embed = SentenceTransformer(_MODEL_NAME, backend=backend)
+            if backend == "torch" and os.getenv(_INT8_ENV_VAR, "0") == "1":
+                _quantize_int8(embed)
+            # KeyBERT는 encode() 배치 크기를 직접 노출하지 않으므로 백엔드에 넘겨준다.
+            # (길이 정렬은 SentenceTransformer.encode가 배치 구성 전에 이미 수행한다.)
+            batch_size = int(os.getenv(_BATCH_SIZE_ENV_VAR, str(_DEFAULT_BATCH_SIZE)))
+            _SENT_EMBED = embed
+            _KEYBERT = KeyBERT(
+                model=SentenceTransformerBackend(embed, batch_size=batch_size)
+            )
+        return _KEYBERT, _SENT_EMBED
+
+
+def _result_cache_key(text: str, top_n_keywords: int) -> bytes:
+    """텍스트 원문 대신 고정 길이 다이제스트를 키로 써서 캐시 메모리를 제한."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(top_n_keywords).encode("ascii"))
+    digest.update(b"\x00")
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _cache_get(key: bytes):
+    with _RESULT_CACHE_LOCK:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return cached
+
+
+def _cache_put(key: bytes, keywords: list, key_sents: list) -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = (tuple(keywords), tuple(key_sents))
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def preload_models() -> None:
+    """서버 기동 시 모델을 미리 로드해 첫 요청이 로딩 비용을 떠안지 않게 한다."""
+    _get_models()
 
 
 def keybert_analyze(
@@ -46,6 +127,7 @@ def keybert_analyze(
 ) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
     """
     입력 텍스트에서 키워드(top_n)와 핵심문장(각 문장당 1개 후보)을 추출.
+    입력이 너무 짧으면 모델을 호출하지 않고 ([], [])를 반환한다.
 
     Returns:
         keywords: [(키워드, 점수), ...] 길이 top_n
@@ -55,6 +137,18 @@ def keybert_analyze(
         raise TypeError("text must be a string")
 
     text = text.replace("\x00", " ")  # 혹시 입력 문자열에 null byte가 섞였을 경우 예방
+    text = text.strip()
+
+    # 몇 단어짜리 입력에는 트랜스포머를 돌려도 의미 있는 결과가 나오지 않는다.
+    if len(text) < _MIN_TEXT_CHARS or len(text.split()) < _MIN_TEXT_WORDS:
+        return [], []
+
+    # 동일 요청이 반복되면 임베딩 계산 없이 이전 결과를 돌려준다.
+    # (키워드(1-gram)와 핵심구절(5~10-gram)은 후보 어휘가 달라 단어 임베딩을 공유할 수 없다.)
+    cache_key = _result_cache_key(text, top_n_keywords)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return list(cached[0]), list(cached[1])
 
     kb, _ = _get_models()
 
@@ -67,24 +161,36 @@ def keybert_analyze(
     )
 
     # 2) 문장 분할 후, 각 문장에서 긴 n-gram 기반 핵심 구절 1개씩 추출
-    sents = split_sentences_ko(text)
+    min_tokens = _KEYPHRASE_NGRAM_RANGE[0]
+    sents = [
+        sent
+        for sent in split_sentences_ko(text)
+        if len(_TOKEN_PATTERN.findall(sent)) >= min_tokens
+    ]
     key_sents: List[Tuple[str, float]] = []
 
     if sents:
+        # 머리말/면책 문구처럼 반복되는 문장은 한 번만 임베딩한다.
+        unique_sents = list(dict.fromkeys(sents))
         # KeyBERT는 리스트 입력 시 문서별 결과 리스트를 반환한다.
         # 여기서는 각 문장마다 top_n=1로 1개씩만 뽑아서 평탄화한다.
+        # CountVectorizer는 호출당 문장 전체에 한 번만 fit되고, vectorizer=로 넘겨도
+        # KeyBERT가 다시 fit하므로 미리 fit한 벡터라이저를 재사용해도 이득이 없다.
         per_sent = kb.extract_keywords(
-            sents,
-            keyphrase_ngram_range=(5, 10),  # 긴 구절 위주
+            unique_sents,
+            keyphrase_ngram_range=_KEYPHRASE_NGRAM_RANGE,
             use_mmr=False,
             top_n=1,
         )
+        # 문서가 하나뿐이면 KeyBERT가 [(phrase, score)]로 평탄화해 돌려준다.
+        if len(unique_sents) == 1:
+            per_sent = [per_sent]
         # per_sent는 [[(phrase, score)] , [(phrase, score)], ...] 형태
-        for items in per_sent:
-            if items:
-                key_sents.append(items[0])
+        best = {sent: items[0] for sent, items in zip(unique_sents, per_sent) if items}
+        key_sents = [best[sent] for sent in sents if sent in best]
 
+    _cache_put(cache_key, keywords, key_sents)
     return keywords, key_sents
 
 
-__all__ = ["keybert_analyze", "split_sentences_ko"]
+__all__ = ["keybert_analyze", "preload_models", "split_sentences_ko"]
@@ -1,3 +1,46 @@
-"""Tests for the PDF extractor (implementation pending)."""
+"""Tests for the PDF extractor."""
 
-# TODO: add fixture-based tests once extractor logic is implemented.
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from app.extraction.handlers import pdf
+
+
+def _write_pdf(path, page_texts):
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_extract_pdf_head_text_limits_pages(tmp_path):
+    path = _write_pdf(tmp_path / "doc.pdf", ["first page", "second page", "third page"])
+
+    text = pdf.extract_pdf_head_text(path, n_pages=2)
+
+    assert "first page" in text
+    assert "second page" in text
+    assert "third page" not in text
+
+
+def test_extract_pdf_head_text_keeps_page_order(tmp_path):
+    page_texts = [f"page number {index}" for index in range(9)]
+    path = _write_pdf(tmp_path / "long.pdf", page_texts)
+
+    text = pdf.extract_pdf_head_text(path, n_pages=len(page_texts))
+
+    assert [line for line in text.splitlines() if line] == page_texts
+
+
+def test_split_sentences_ko_splits_on_terminators():
+    text = "네뷸라는 문서를 분석합니다.  다음 문장은\n물음표로 끝나나요? Yes 라고 답할 수 있다. 짧다."
+
+    assert pdf.split_sentences_ko(text) == [
+        "네뷸라는 문서를 분석합니다.",
+        "다음 문장은 물음표로 끝나나요?",
+        "Yes 라고 답할 수 있다.",
+    ]
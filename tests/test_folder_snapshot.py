@@ -1,11 +1,14 @@
 """Tests for the recursive folder snapshot API endpoint."""
 
+import errno
 import json
+from datetime import datetime
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services import folder_snapshot
 
 
 client = TestClient(app)
@@ -43,12 +46,18 @@ def test_snapshot_creates_single_file(tmp_path, monkeypatch):
     assert snapshot_path.exists()
 
     data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    assert data["total_entries"] == 3
+    assert data["page_count"] == 1
     relative_paths = {entry["relative_path"] for entry in data["entries"]}
     assert "alpha.txt" in relative_paths
     assert "nested" in relative_paths
     assert "nested/beta.txt" in relative_paths
     assert not any(path.startswith(".hidden") for path in relative_paths)
 
+    assert datetime.fromisoformat(data["generated_at"]).utcoffset().total_seconds() == 0
+    for entry in data["entries"]:
+        assert datetime.fromisoformat(entry["modified_at"]).utcoffset().total_seconds() == 0
+
 
 def test_snapshot_honors_page_size(tmp_path, monkeypatch):
     target_dir = tmp_path / "source"
@@ -79,3 +88,105 @@ def test_snapshot_honors_page_size(tmp_path, monkeypatch):
         assert len(data["entries"]) == page["entry_count"]
         assert data["page"] == page["page"]
         assert data["page_size"] == 2
+
+
+def test_snapshot_orders_entries_depth_first(tmp_path, monkeypatch):
+    target_dir = tmp_path / "source"
+    (target_dir / "b_dir" / "inner").mkdir(parents=True)
+    (target_dir / "A_dir").mkdir()
+    (target_dir / "A_dir" / "z.txt").write_text("z", encoding="utf-8")
+    (target_dir / "b_dir" / "inner" / "deep.txt").write_text("d", encoding="utf-8")
+    (target_dir / "b_dir" / "c.txt").write_text("c", encoding="utf-8")
+    (target_dir / "root.txt").write_text("r", encoding="utf-8")
+
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+
+    response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+
+    assert response.status_code == 200
+    snapshot_path = Path(response.json()["pages"][0]["path"])
+    data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+
+    assert [entry["relative_path"] for entry in data["entries"]] == [
+        "A_dir",
+        "b_dir",
+        "root.txt",
+        "A_dir/z.txt",
+        "b_dir/inner",
+        "b_dir/c.txt",
+        "b_dir/inner/deep.txt",
+    ]
+    nested = next(entry for entry in data["entries"] if entry["relative_path"] == "b_dir/c.txt")
+    assert nested["absolute_path"] == str(target_dir.resolve() / "b_dir" / "c.txt")
+
+
+def test_snapshot_skips_snapshot_dir_inside_target(tmp_path, monkeypatch):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+    (target_dir / "a.txt").write_text("abc", encoding="utf-8")
+
+    monkeypatch.setenv("SNAPSHOT_DIR", str(target_dir / "snapshots"))
+
+    for page_size in (None, 1):
+        response = client.post(
+            "/folders/snapshot",
+            json={"path": str(target_dir), "page_size": page_size},
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["total_entries"] == 1
+
+        for page in payload["pages"]:
+            data = json.loads(Path(page["path"]).read_text(encoding="utf-8"))
+            assert [entry["relative_path"] for entry in data["entries"]] == ["a.txt"]
+
+
+def test_snapshot_files_share_key_order_across_modes(tmp_path, monkeypatch):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+    for index in range(3):
+        (target_dir / f"file_{index}.txt").write_text("x", encoding="utf-8")
+
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+
+    expected_keys = [
+        "directory",
+        "generated_at",
+        "page",
+        "page_count",
+        "page_size",
+        "entries",
+        "total_entries",
+    ]
+    for page_size in (None, 2):
+        response = client.post(
+            "/folders/snapshot",
+            json={"path": str(target_dir), "page_size": page_size},
+        )
+
+        assert response.status_code == 200
+        for page in response.json()["pages"]:
+            data = json.loads(Path(page["path"]).read_text(encoding="utf-8"))
+            assert list(data) == expected_keys
+            assert data["total_entries"] == 3
+
+
+def test_snapshot_traversal_error_is_not_reported_as_write_error(tmp_path, monkeypatch):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+    (target_dir / "loop.txt").write_text("x", encoding="utf-8")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    def failing_from_dir_entry(entry, relative_path):
+        raise OSError(errno.ELOOP, "Too many levels of symbolic links")
+
+    monkeypatch.setattr(folder_snapshot.SnapshotEntry, "from_dir_entry", failing_from_dir_entry)
+
+    response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "스냅샷 대상 항목을 읽을 수 없습니다."
+    assert list(snapshot_root.iterdir()) == []
@@ -0,0 +1,49 @@
+"""Tests for application startup behavior."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+def test_startup_preloads_models(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "preload_models", lambda: calls.append(True))
+    monkeypatch.delenv("PRELOAD_MODELS", raising=False)
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").status_code == 200
+
+    assert calls == [True]
+
+
+def test_startup_skips_preload_when_disabled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "preload_models", lambda: calls.append(True))
+    monkeypatch.setenv("PRELOAD_MODELS", "0")
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").status_code == 200
+
+    assert calls == []
+
+
+def test_importing_app_does_not_load_heavy_dependencies():
+    heavy = ["torch", "sentence_transformers", "keybert", "fitz", "pymupdf"]
+    script = (
+        "import sys, app.main, app.extraction.handlers.pdf; "
+        f"print([name for name in {heavy!r} if name in sys.modules])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,40 @@
+"""API tests for the keyword extraction endpoint."""
+
+import threading
+
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+client = TestClient(main.app)
+
+
+def test_extract_keywords_runs_analysis_off_the_event_loop(monkeypatch):
+    seen_threads = []
+
+    def fake_analyze(text):
+        seen_threads.append(threading.current_thread().name)
+        return [("네뷸라", 0.9)], [("네뷸라 프로젝트는 텍스트를 추출합니다", 0.8)]
+
+    monkeypatch.setattr(main, "keybert_analyze", fake_analyze)
+
+    response = client.post("/text/keywords", json={"text": "네뷸라 프로젝트는 텍스트를 추출합니다."})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["keywords"] == [["네뷸라", 0.9]]
+    assert payload["key_sentences"] == [["네뷸라 프로젝트는 텍스트를 추출합니다", 0.8]]
+    assert seen_threads and seen_threads[0].startswith("keyword")
+
+
+def test_extract_keywords_failure_returns_500(monkeypatch):
+    def failing_analyze(text):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(main, "keybert_analyze", failing_analyze)
+
+    response = client.post("/text/keywords", json={"text": "본문"})
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "키워드 추출 중 오류가 발생했습니다: boom"
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Sequence, Tuple
+import sys
+import threading
+import time
+import types
+from typing import Any, List, Mapping, Sequence, Tuple
 
 import pytest
 
@@ -15,17 +19,23 @@ class FakeKeyBERT:
     def __init__(
         self,
         keyword_result: Sequence[Tuple[str, float]],
-        sentence_result: Sequence[Sequence[Tuple[str, float]]],
+        sentence_result: Mapping[str, Sequence[Tuple[str, float]]],
         *,
         raise_on_empty: bool = True,
     ) -> None:
         self._keyword_result = list(keyword_result)
-        self._sentence_result = [list(items) for items in sentence_result]
+        self._sentence_result = {
+            sentence: list(items) for sentence, items in sentence_result.items()
+        }
         self._raise_on_empty = raise_on_empty
+        self.calls: List[Any] = []
 
     def extract_keywords(self, target: Any, **kwargs: Any) -> List[Any]:
+        self.calls.append(target)
         if isinstance(target, list):
-            return [list(items) for items in self._sentence_result]
+            results = [list(self._sentence_result.get(sentence, [])) for sentence in target]
+            # KeyBERT flattens the result when a single document is passed.
+            return results[0] if len(results) == 1 else results
 
         if not isinstance(target, str):
             raise TypeError("target must be a string")
@@ -37,6 +47,11 @@ class FakeKeyBERT:
         return list(self._keyword_result[:top_n])
 
 
+@pytest.fixture(autouse=True)
+def _clear_result_cache() -> None:
+    keyword_extractor._RESULT_CACHE.clear()
+
+
 def _patch_models(monkeypatch: pytest.MonkeyPatch, fake: FakeKeyBERT) -> None:
     monkeypatch.setattr(keyword_extractor, "_get_models", lambda: (fake, object()))
 
@@ -47,32 +62,154 @@ def test_keybert_analyze_returns_keywords_and_sentences(monkeypatch: pytest.Monk
         ("텍스트 분석", 0.83),
         ("PDF 추출", 0.72),
     ]
-    sentence_candidates = [
-        [("네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다", 0.88)],
-        [("또한 한국어 키워드를 분석합니다", 0.79)],
-    ]
+    sentence_candidates = {
+        "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다": [
+            ("네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다", 0.88)
+        ],
+        "또한 한국어 키워드와 핵심 문장을 함께 분석합니다": [
+            ("또한 한국어 키워드와 핵심 문장을 함께 분석합니다", 0.79)
+        ],
+    }
     fake_kb = FakeKeyBERT(keyword_candidates, sentence_candidates, raise_on_empty=False)
     _patch_models(monkeypatch, fake_kb)
 
-    text = "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다. 또한 한국어 키워드를 분석합니다!"
+    text = "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다. 또한 한국어 키워드와 핵심 문장을 함께 분석합니다!"
 
     keywords, key_sentences = keyword_extractor.keybert_analyze(text, top_n_keywords=2)
 
     assert keywords == keyword_candidates[:2]
-    assert key_sentences == [items[0] for items in sentence_candidates]
+    assert key_sentences == [items[0] for items in sentence_candidates.values()]
+
+
+def test_keybert_analyze_embeds_duplicate_sentences_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    boilerplate = "본 문서는 사내 배포용 참고 자료입니다"
+    body = "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다"
+    fake_kb = FakeKeyBERT(
+        [("네뷸라", 0.9)],
+        {boilerplate: [(boilerplate, 0.5)], body: [(body, 0.88)]},
+        raise_on_empty=False,
+    )
+    _patch_models(monkeypatch, fake_kb)
+
+    text = f"{boilerplate}. {body}. {boilerplate}."
+
+    _, key_sentences = keyword_extractor.keybert_analyze(text)
+
+    sentence_calls = [call for call in fake_kb.calls if isinstance(call, list)]
+    assert sentence_calls == [[boilerplate, body]]
+    assert key_sentences == [(boilerplate, 0.5), (body, 0.88), (boilerplate, 0.5)]
+
+
+def test_keybert_analyze_handles_single_unique_sentence(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sentence = "본 문서는 사내 배포용 참고 자료입니다"
+    fake_kb = FakeKeyBERT(
+        [("문서", 0.7)],
+        {sentence: [(sentence, 0.6)]},
+        raise_on_empty=False,
+    )
+    _patch_models(monkeypatch, fake_kb)
+
+    _, key_sentences = keyword_extractor.keybert_analyze(f"{sentence}. {sentence}.")
+
+    assert key_sentences == [(sentence, 0.6), (sentence, 0.6)]
+
+
+def test_keybert_analyze_reuses_cached_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_kb = FakeKeyBERT(
+        [("네뷸라", 0.9)],
+        {
+            "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다": [
+                ("네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다", 0.88)
+            ]
+        },
+        raise_on_empty=False,
+    )
+    _patch_models(monkeypatch, fake_kb)
+
+    text = "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다."
+
+    first = keyword_extractor.keybert_analyze(text)
+    calls_after_first = len(fake_kb.calls)
+    second = keyword_extractor.keybert_analyze(text)
+
+    assert second == first
+    assert len(fake_kb.calls) == calls_after_first
+
+    keyword_extractor.keybert_analyze(text, top_n_keywords=1)
+    assert len(fake_kb.calls) > calls_after_first
+
+
+def test_get_models_loads_once_under_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: List[str] = []
+
+    class SlowSentenceTransformer:
+        def __init__(self, name: str, **kwargs: Any) -> None:
+            loads.append(name)
+            time.sleep(0.05)
+
+    sentence_transformers = types.ModuleType("sentence_transformers")
+    sentence_transformers.SentenceTransformer = SlowSentenceTransformer
+    keybert = types.ModuleType("keybert")
+    keybert.KeyBERT = lambda model: ("keybert", model)
+    keybert_backend = types.ModuleType("keybert.backend")
+    keybert_backend.SentenceTransformerBackend = lambda embed, **kwargs: embed
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", sentence_transformers)
+    monkeypatch.setitem(sys.modules, "keybert", keybert)
+    monkeypatch.setitem(sys.modules, "keybert.backend", keybert_backend)
+    monkeypatch.setattr(keyword_extractor, "_KEYBERT", None)
+    monkeypatch.setattr(keyword_extractor, "_SENT_EMBED", None)
+    monkeypatch.delenv("EMBED_INT8", raising=False)
+
+    results: List[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(keyword_extractor._get_models()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [keyword_extractor._MODEL_NAME]
+    assert len(results) == 4
+    assert all(result == results[0] for result in results)
 
 
 def test_keybert_analyze_rejects_non_string(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_kb = FakeKeyBERT([], [], raise_on_empty=False)
+    fake_kb = FakeKeyBERT([], {}, raise_on_empty=False)
     _patch_models(monkeypatch, fake_kb)
 
     with pytest.raises(TypeError):
         keyword_extractor.keybert_analyze(123)  # type: ignore[arg-type]
 
 
-def test_keybert_analyze_propagates_empty_text_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_kb = FakeKeyBERT([], [], raise_on_empty=True)
+def test_keybert_analyze_skips_short_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_kb = FakeKeyBERT([], {}, raise_on_empty=True)
+    _patch_models(monkeypatch, fake_kb)
+
+    assert keyword_extractor.keybert_analyze("   ") == ([], [])
+    assert keyword_extractor.keybert_analyze("짧은 입력") == ([], [])
+    assert fake_kb.calls == []
+
+
+def test_keybert_analyze_skips_sentences_without_phrase_candidates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    long_sentence = "네뷸라 프로젝트는 PDF에서 텍스트를 추출합니다"
+    fake_kb = FakeKeyBERT(
+        [("네뷸라", 0.9)],
+        {long_sentence: [(long_sentence, 0.88)]},
+        raise_on_empty=False,
+    )
     _patch_models(monkeypatch, fake_kb)
 
-    with pytest.raises(ValueError, match="empty vocabulary"):
-        keyword_extractor.keybert_analyze("   ")
+    _, key_sentences = keyword_extractor.keybert_analyze(f"{long_sentence}. 짧은 문장입니다!")
+
+    sentence_calls = [call for call in fake_kb.calls if isinstance(call, list)]
+    assert sentence_calls == [[long_sentence]]
+    assert key_sentences == [(long_sentence, 0.88)]